@@ -0,0 +1,109 @@
+"""
+Rendering benchmark for Sokoban game.
+Compares the original per-cell rendering path (terminal check, mapping
+and print() call for every cell) with the precomputed translation table
+and row cache used by display.print_board().
+
+Usage:
+    python bench_render.py
+    python bench_render.py --frames 200
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+import display
+from display import Colors
+from levels import get_level, get_total_levels
+
+
+class TerminalBuffer(io.StringIO):
+    """In-memory output that reports itself as a terminal (or not)."""
+
+    def __init__(self, tty):
+        super().__init__()
+        self.tty = tty
+
+    def isatty(self):
+        return self.tty
+
+
+def legacy_display_char(cell):
+    """The per-cell conversion as it was before the render tables."""
+    supports_color = sys.stdout.isatty() and (sys.platform != 'win32' or os.getenv('TERM') != 'dumb')
+    if not supports_color:
+        mapping = {'#': '▓', ' ': ' ', '@': '☺', '$': '▦', '.': '○', '*': '▦', '+': '☺'}
+        return mapping.get(cell, cell)
+    if cell == '#':
+        return f"{Colors.GRAY}▓{Colors.RESET}"
+    elif cell == ' ':
+        return ' '
+    elif cell == '@':
+        return f"{Colors.CYAN}{Colors.BOLD}☺{Colors.RESET}"
+    elif cell == '$':
+        return f"{Colors.YELLOW}▦{Colors.RESET}"
+    elif cell == '.':
+        return f"{Colors.RED}○{Colors.RESET}"
+    elif cell == '*':
+        return f"{Colors.GREEN}{Colors.BOLD}▦{Colors.RESET}"
+    elif cell == '+':
+        return f"{Colors.GREEN}{Colors.BOLD}☺{Colors.RESET}"
+    else:
+        return cell
+
+
+def legacy_print_board(board):
+    """The per-cell print_board() as it was before the render tables."""
+    print("=" * (len(board[0]) * 2 + 2))
+    for row in board:
+        print("|", end="")
+        for cell in row:
+            display_char = legacy_display_char(cell)
+            print(f" {display_char}", end="")
+        print(" |")
+    print("=" * (len(board[0]) * 2 + 2))
+
+
+def time_frames(render, boards, frames, tty):
+    """
+    Render every board repeatedly and return the output and seconds per frame.
+    """
+    output = TerminalBuffer(tty)
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        for _ in range(frames):
+            for board in boards:
+                render(board)
+    elapsed = time.perf_counter() - started
+    return output.getvalue(), elapsed / (frames * len(boards))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark board rendering.")
+    parser.add_argument('--frames', type=int, default=100, help="frames per level")
+    args = parser.parse_args()
+
+    boards = [get_level(number) for number in range(get_total_levels())]
+    boards = [board for board in boards if board is not None]
+
+    print(f"{'Mode':<7} {'Per-cell us':>12} {'Tables us':>10} {'Speedup':>8}")
+    for tty in (False, True):
+        display.init_display(use_color=tty)
+        legacy_output, legacy_time = time_frames(legacy_print_board, boards, args.frames, tty)
+        table_output, table_time = time_frames(display.print_board, boards, args.frames, tty)
+        if legacy_output != table_output:
+            print("Output mismatch between rendering paths!")
+            return
+        mode = 'color' if tty else 'plain'
+        print(f"{mode:<7} {legacy_time * 1e6:>12.1f} {table_time * 1e6:>10.1f} "
+              f"{legacy_time / table_time:>7.1f}x")
+    display.init_display()
+
+
+if __name__ == "__main__":
+    main()
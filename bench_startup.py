@@ -0,0 +1,94 @@
+"""
+Startup benchmark for Sokoban game.
+Starts a fresh interpreter for each entry point, measures the time to
+import it (and, for the game, to load the first level), and checks that
+no terminal module is imported before the game actually reads a key.
+
+Exits with status 1 if any entry point is over budget or loads a
+terminal module, so it can guard startup time in scripts.
+
+Usage:
+    python bench_startup.py
+    python bench_startup.py --runs 20 --budget-ms 80
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Cold start budget per entry point, on top of a bare interpreter start
+STARTUP_BUDGET_MS = 60
+
+# Modules that only the interactive keyboard input needs
+TERMINAL_MODULES = ['termios', 'tty', 'msvcrt']
+
+# Entry point name -> code run in the fresh interpreter
+ENTRY_POINTS = {
+    'main': "import main; main.get_level(0)",
+    'pushgen': "import pushgen",
+    'generator': "import generator",
+    'external_bfs': "import external_bfs",
+    'level_index': "import level_index; level_index.load_index()",
+    'loadtest': "import loadtest",
+    'bench_render': "import bench_render",
+}
+
+REPORT = "; import sys; print(','.join(m for m in {modules!r} if m in sys.modules))"
+
+
+def time_command(code, runs):
+    """
+    Run code in fresh interpreters and time each start.
+
+    Args:
+        code: Python source passed to -c
+        runs: Number of interpreter starts
+
+    Returns:
+        times, output: Wall times in milliseconds and the last run's stdout
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    times = []
+    output = ''
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', code], cwd=here,
+                                capture_output=True, text=True, check=True)
+        times.append((time.perf_counter() - started) * 1000)
+        output = result.stdout.strip()
+    return times, output
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Measure cold start time of each entry point.")
+    parser.add_argument('--runs', type=int, default=10, help="interpreter starts per entry point")
+    parser.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS,
+                        help="allowed startup time above a bare interpreter")
+    args = parser.parse_args()
+
+    # Compile everything once so later runs measure a normal cold start
+    time_command("import " + ", ".join(ENTRY_POINTS), 1)
+    bare, _ = time_command("pass", args.runs)
+    baseline = statistics.median(bare)
+    print(f"Bare interpreter: {baseline:.1f} ms (median of {args.runs})")
+    print(f"{'Entry point':<14} {'Median ms':>10} {'Over bare':>10} {'Terminal modules':>18}  Result")
+
+    failed = False
+    for name, code in ENTRY_POINTS.items():
+        times, loaded = time_command(code + REPORT.format(modules=TERMINAL_MODULES), args.runs)
+        median = statistics.median(times)
+        ok = median - baseline <= args.budget_ms and not loaded
+        failed = failed or not ok
+        print(f"{name:<14} {median:>10.1f} {median - baseline:>10.1f} {loaded or '-':>18}  "
+              f"{'OK' if ok else 'FAIL'}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,16 @@ Provides all rendering and display functionality.
 import os
 import sys
 
+# Screen lines used around the board by the level screen
+# (header, board borders, controls, progress and input prompt)
+RESERVED_LINES = 17
+
+# Cells kept between the player and the viewport edge when scrolling
+VIEWPORT_MARGIN = 3
+
+# Levels shown per page in level select
+LEVEL_LIST_PAGE_SIZE = 20
+
 # ANSI color codes
 class Colors:
     """ANSI color codes for terminal output."""
@@ -27,6 +37,62 @@ class Colors:
     BG_BROWN = '\033[43m'
 
 
+# Display symbols for each XSB character, without and with color
+PLAIN_CHARS = {
+    '#': '▓',  # Wall
+    ' ': ' ',  # Floor
+    '@': '☺',  # Player
+    '$': '▦',  # Box
+    '.': '○',  # Target
+    '*': '▦',  # Box on target
+    '+': '☺',  # Player on target
+}
+COLOR_CHARS = {
+    '#': f"{Colors.GRAY}▓{Colors.RESET}",
+    ' ': ' ',
+    '@': f"{Colors.CYAN}{Colors.BOLD}☺{Colors.RESET}",
+    '$': f"{Colors.YELLOW}▦{Colors.RESET}",
+    '.': f"{Colors.RED}○{Colors.RESET}",
+    '*': f"{Colors.GREEN}{Colors.BOLD}▦{Colors.RESET}",
+    '+': f"{Colors.GREEN}{Colors.BOLD}☺{Colors.RESET}",
+}
+
+# Rendering state, set up once by init_display()
+_display_chars = None
+_row_table = None
+_row_cache = {}
+
+# Rendered rows kept before the cache is emptied
+ROW_CACHE_LIMIT = 4096
+
+
+def terminal_supports_color():
+    """
+    Check if the terminal supports colors (basic check).
+
+    Returns:
+        bool: True if ANSI colors should be used
+    """
+    return sys.stdout.isatty() and (sys.platform != 'win32' or os.getenv('TERM') != 'dumb')
+
+
+def init_display(use_color=None):
+    """
+    Detect terminal capabilities once and compile the render tables.
+    Call again after redirecting stdout to pick up the new terminal.
+
+    Args:
+        use_color: Force colors on or off (None = detect from the terminal)
+    """
+    global _display_chars, _row_table
+    if use_color is None:
+        use_color = terminal_supports_color()
+    _display_chars = COLOR_CHARS if use_color else PLAIN_CHARS
+    # Each cell renders as a space followed by its symbol
+    _row_table = str.maketrans({cell: f" {char}" for cell, char in _display_chars.items()})
+    _row_cache.clear()
+
+
 def get_display_char(cell):
     """
     Convert XSB format character to display character with color.
@@ -37,39 +103,36 @@ def get_display_char(cell):
     Returns:
         str: Colored Unicode character for display
     """
-    # Check if terminal supports colors (basic check)
-    supports_color = sys.stdout.isatty() and (sys.platform != 'win32' or os.getenv('TERM') != 'dumb')
-    
-    if not supports_color:
-        # Fallback: Unicode symbols without colors
-        mapping = {
-            '#': '▓',
-            ' ': ' ',
-            '@': '☺',
-            '$': '▦',
-            '.': '○',
-            '*': '▦',
-            '+': '☺'
-        }
-        return mapping.get(cell, cell)
-    
-    # Color mapping with Unicode symbols
-    if cell == '#':  # Wall
-        return f"{Colors.GRAY}▓{Colors.RESET}"
-    elif cell == ' ':  # Floor
-        return ' '
-    elif cell == '@':  # Player
-        return f"{Colors.CYAN}{Colors.BOLD}☺{Colors.RESET}"
-    elif cell == '$':  # Box
-        return f"{Colors.YELLOW}▦{Colors.RESET}"
-    elif cell == '.':  # Target
-        return f"{Colors.RED}○{Colors.RESET}"
-    elif cell == '*':  # Box on target
-        return f"{Colors.GREEN}{Colors.BOLD}▦{Colors.RESET}"
-    elif cell == '+':  # Player on target
-        return f"{Colors.GREEN}{Colors.BOLD}☺{Colors.RESET}"
-    else:
-        return cell
+    if _display_chars is None:
+        init_display()
+    return _display_chars.get(cell, cell)
+
+
+def render_row(cells):
+    """
+    Render one board row (with side borders) as a single string.
+    Rows are cached by their contents, so unchanged rows are reused.
+
+    Args:
+        cells: List of XSB characters
+
+    Returns:
+        str: Display line for the row
+    """
+    if _row_table is None:
+        init_display()
+    key = ''.join(cells)
+    line = _row_cache.get(key)
+    if line is None:
+        if len(_row_cache) >= ROW_CACHE_LIMIT:
+            _row_cache.clear()
+        if _display_chars.keys() >= set(key):
+            line = "|" + key.translate(_row_table) + " |"
+        else:
+            # Unknown symbols are shown as-is, one per cell
+            line = "|" + ''.join(f" {get_display_char(cell)}" for cell in key) + " |"
+        _row_cache[key] = line
+    return line
 
 
 def clear_screen():
@@ -91,14 +154,82 @@ def print_board(board):
     Args:
         board: 2D list of strings representing the game state
     """
-    print("=" * (len(board[0]) * 2 + 2))
+    border = "=" * (len(board[0]) * 2 + 2)
+    lines = [border]
     for row in board:
-        print("|", end="")
-        for cell in row:
-            display_char = get_display_char(cell)
-            print(f" {display_char}", end="")
-        print(" |")
-    print("=" * (len(board[0]) * 2 + 2))
+        lines.append(render_row(row))
+    lines.append(border)
+    print("\n".join(lines))
+
+
+def get_viewport_size():
+    """
+    Work out how many board cells fit in the terminal.
+    Each cell is two characters wide and the board has a border on each side.
+
+    Returns:
+        rows, columns: Number of visible board rows and columns
+    """
+    # Imported here: shutil is only needed once a level is on screen
+    import shutil
+
+    terminal = shutil.get_terminal_size()
+    rows = max(3, terminal.lines - RESERVED_LINES)
+    columns = max(3, (terminal.columns - 3) // 2)
+    return rows, columns
+
+
+def scroll_viewport(origin, player, board_size, view_size, margin=VIEWPORT_MARGIN):
+    """
+    Move a viewport along one axis so the player stays inside the margin.
+
+    Args:
+        origin: Current first visible row or column
+        player: Player row or column
+        board_size: Board height or width
+        view_size: Visible rows or columns
+        margin: Cells to keep between the player and the edge
+
+    Returns:
+        int: New first visible row or column
+    """
+    if board_size <= view_size:
+        return 0
+    margin = min(margin, (view_size - 1) // 2)
+    if player < origin + margin:
+        origin = player - margin
+    elif player > origin + view_size - 1 - margin:
+        origin = player - view_size + 1 + margin
+    return max(0, min(origin, board_size - view_size))
+
+
+def print_board_viewport(board, player_pos, origin=(0, 0)):
+    """
+    Display only the part of the board that fits in the terminal,
+    scrolled to follow the player. Offscreen cells are never rendered,
+    so the cost of a frame does not depend on the size of the level.
+
+    Args:
+        board: 2D list of strings representing the game state
+        player_pos: (row, col) of the player
+        origin: (row, col) of the top-left visible cell in the previous frame
+
+    Returns:
+        tuple: (row, col) of the top-left visible cell, to pass to the next frame
+    """
+    view_rows, view_columns = get_viewport_size()
+    top = scroll_viewport(origin[0], player_pos[0], len(board), view_rows)
+    left = scroll_viewport(origin[1], player_pos[1], len(board[0]), view_columns)
+    bottom = min(len(board), top + view_rows)
+    right = min(len(board[0]), left + view_columns)
+
+    border = "=" * ((right - left) * 2 + 2)
+    lines = [border]
+    for row in board[top:bottom]:
+        lines.append(render_row(row[left:right]))
+    lines.append(border)
+    print("\n".join(lines))
+    return top, left
 
 
 def print_level_header(level_number, moves):
@@ -153,20 +284,55 @@ def print_main_menu():
     print("="*50)
     print("\nSelect a game mode:")
     print("  1. Progression Mode (Levels 0-4)")
-    print("  2. Level Select Mode (Any level 0-50)")
+    print("  2. Level Select Mode (Browse and filter all levels)")
     print("  Q. Quit")
     print("\n" + "="*50)
 
 
-def print_level_select_prompt():
+def print_level_select_prompt(first_level=0, last_level=50):
     """
     Display prompt for level selection.
     BONUS #2: Prompt for level selection in Level Select Mode
+
+    Args:
+        first_level: Lowest level number available
+        last_level: Highest level number available
     """
     print("\n" + "="*50)
     print("LEVEL SELECT MODE".center(50))
     print("="*50)
-    print("Choose any level from 0 to 50 to play.")
+    print(f"Choose any level from {first_level} to {last_level} to play.")
+
+
+def print_level_list(entries, total, description, offset=0, limit=LEVEL_LIST_PAGE_SIZE):
+    """
+    Display one page of a table of levels from the metadata index.
+
+    Args:
+        entries: Index entries to show (already filtered and sorted)
+        total: Number of levels in the index
+        description: Current filter and sort, shown above the table
+        offset: Index of the first entry on this page
+        limit: Maximum number of rows to show
+    """
+    page = entries[offset:offset + limit]
+    if page:
+        showing = f"Showing {offset + 1}-{offset + len(page)}"
+    else:
+        showing = "Showing 0"
+    print(f"\n{showing} of {len(entries)} matching ({total} levels) | {description}")
+    print(f"{'Level':>6} {'Size':>7} {'Boxes':>6} {'Floor':>6} {'Diff':>6} {'Pushes':>7}")
+    for entry in page:
+        size = f"{entry['width']}x{entry['height']}"
+        pushes = entry['pushes'] if entry['pushes'] is not None else '-'
+        print(f"{entry['number']:>6} {size:>7} {entry['boxes']:>6} {entry['floor']:>6} "
+              f"{entry['difficulty']:>6} {pushes:>7}")
+    print("\nEnter a level number to play")
+    print("  F <filter>  - Filter, e.g. F boxes<=6 fits 40x20 (F alone clears)")
+    print("  S <field>   - Sort by number, width, height, boxes, floor,")
+    print("                difficulty or pushes (S -field for descending)")
+    print("  N / P       - Next / previous page")
+    print("  M           - Return to main menu")
 
 
 def print_level_complete_menu():
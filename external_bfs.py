@@ -0,0 +1,411 @@
+"""
+External-memory breadth-first search for Sokoban levels.
+Explores push space layer by layer, keeping every layer on disk as a sorted
+file of packed state records, so the state space may exceed available RAM.
+
+Each state is the sorted box positions plus the player position normalized
+to the top-left cell of the player's reachable region. Layer k holds every
+state first reached after exactly k pushes, so the first layer containing a
+solved state gives the optimal push count and an empty layer proves the
+level unsolvable.
+
+Usage:
+    python external_bfs.py 0 --memory-mb 64
+    python external_bfs.py 12 --memory-mb 256 --workdir /data/bfs
+"""
+
+import heapq
+import os
+import shutil
+import struct
+import time
+
+from helpers import DIRECTION_STEPS, get_dynamic_state, get_static_layer
+from levels import get_level
+
+# Up, left, down, right as (row, col) steps; STEPS[(d + 2) % 4] is the opposite of d
+STEPS = list(DIRECTION_STEPS.values())
+
+# Maximum number of run files merged in one pass
+MERGE_FAN_IN = 64
+
+# Rough size in memory of one buffered record (bytes object + list slot)
+RECORD_OVERHEAD = 64
+
+
+def build_graph(board):
+    """
+    Number the floor cells reachable by the player and link their neighbours.
+
+    Args:
+        board: 2D list representing the level
+
+    Returns:
+        cells, neighbours, targets: cells is a list of (row, col) per index,
+        neighbours[i][d] is the index one step in direction d (or -1),
+        targets is a frozenset of target indices
+
+    Raises:
+        ValueError: If the board has no player
+    """
+    static_layer = get_static_layer(board)
+    player, _ = get_dynamic_state(board)
+    if player is None:
+        raise ValueError("Level has no player")
+
+    index = {player: 0}
+    cells = [player]
+    for row, col in cells:
+        for vertical_step, horizontal_step in STEPS:
+            cell = (row + vertical_step, col + horizontal_step)
+            if cell in index:
+                continue
+            if not (0 <= cell[0] < len(static_layer) and 0 <= cell[1] < len(static_layer[cell[0]])):
+                continue
+            if static_layer[cell[0]][cell[1]] == '#':
+                continue
+            index[cell] = len(cells)
+            cells.append(cell)
+
+    # Renumber in row-major order so record order follows board order
+    order = sorted(range(len(cells)), key=lambda i: cells[i])
+    cells = [cells[i] for i in order]
+    index = {cell: i for i, cell in enumerate(cells)}
+
+    neighbours = []
+    for row, col in cells:
+        neighbours.append([index.get((row + vertical_step, col + horizontal_step), -1)
+                           for vertical_step, horizontal_step in STEPS])
+    targets = frozenset(index[cell] for cell in index
+                        if static_layer[cell[0]][cell[1]] == '.')
+    return cells, neighbours, targets
+
+
+def find_live_cells(neighbours, targets):
+    """
+    Find the cells from which a box can still reach some target.
+    Pulls boxes backwards from every target; cells never reached are dead,
+    and a box pushed onto one can never be solved.
+
+    Args:
+        neighbours: Neighbour table from build_graph()
+        targets: Target indices
+
+    Returns:
+        set: Live cell indices
+    """
+    live = set(targets)
+    queue = list(targets)
+    for cell in queue:
+        for direction in range(4):
+            # Pull the box one step in this direction: player stands two ahead
+            previous = neighbours[cell][direction]
+            if previous == -1 or neighbours[previous][direction] == -1:
+                continue
+            if previous not in live:
+                live.add(previous)
+                queue.append(previous)
+    return live
+
+
+def normalize_player(neighbours, boxes, player):
+    """
+    Flood-fill the player's region and return its smallest cell index.
+    All player positions within one region describe the same push state.
+
+    Args:
+        neighbours: Neighbour table from build_graph()
+        boxes: Set of box indices
+        player: Player index
+
+    Returns:
+        min_cell, region: Smallest reachable index and set of reachable indices
+    """
+    region = {player}
+    stack = [player]
+    while stack:
+        cell = stack.pop()
+        for neighbour in neighbours[cell]:
+            if neighbour != -1 and neighbour not in region and neighbour not in boxes:
+                region.add(neighbour)
+                stack.append(neighbour)
+    return min(region), region
+
+
+def expand(neighbours, live, boxes, player):
+    """
+    Generate every state reachable from one state with a single push.
+
+    Args:
+        neighbours: Neighbour table from build_graph()
+        live: Live cell indices from find_live_cells()
+        boxes: Tuple of box indices (sorted)
+        player: Normalized player index
+
+    Yields:
+        tuple: (player, boxes) of each successor, player normalized
+    """
+    box_set = set(boxes)
+    _, region = normalize_player(neighbours, box_set, player)
+    for box in boxes:
+        for direction in range(4):
+            destination = neighbours[box][direction]
+            if destination == -1 or destination in box_set or destination not in live:
+                continue
+            # The player must stand on the opposite side of the box
+            behind = neighbours[box][(direction + 2) % 4]
+            if behind == -1 or behind not in region:
+                continue
+            new_boxes = box_set - {box}
+            new_boxes.add(destination)
+            new_player, _ = normalize_player(neighbours, new_boxes, box)
+            yield new_player, tuple(sorted(new_boxes))
+
+
+def iter_records(path, record_size, chunk_records=4096):
+    """
+    Stream fixed-size records from a file.
+
+    Args:
+        path: File of packed records
+        record_size: Bytes per record
+        chunk_records: Records read per disk access
+
+    Yields:
+        bytes: One packed record
+    """
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(record_size * chunk_records)
+            if not chunk:
+                return
+            for offset in range(0, len(chunk), record_size):
+                yield chunk[offset:offset + record_size]
+
+
+def unique(records):
+    """Drop consecutive duplicates from a sorted record stream."""
+    previous = None
+    for record in records:
+        if record != previous:
+            yield record
+            previous = record
+
+
+def write_records(path, records):
+    """
+    Write a record stream to a file.
+
+    Returns:
+        int: Number of records written
+    """
+    count = 0
+    with open(path, 'wb') as f:
+        for record in records:
+            f.write(record)
+            count += 1
+    return count
+
+
+def merge_runs(runs, record_size, workdir):
+    """
+    Merge sorted run files into as few runs as the fan-in allows,
+    deleting the inputs as they are consumed.
+
+    Args:
+        runs: List of sorted run file paths
+        record_size: Bytes per record
+        workdir: Directory for intermediate files
+
+    Returns:
+        list: At most MERGE_FAN_IN sorted run file paths
+    """
+    generation = 0
+    while len(runs) > MERGE_FAN_IN:
+        merged = []
+        for start in range(0, len(runs), MERGE_FAN_IN):
+            group = runs[start:start + MERGE_FAN_IN]
+            path = os.path.join(workdir, f"merge_{generation}_{start}.bin")
+            streams = [iter_records(run, record_size) for run in group]
+            write_records(path, unique(heapq.merge(*streams)))
+            for run in group:
+                os.remove(run)
+            merged.append(path)
+        runs = merged
+        generation += 1
+    return runs
+
+
+def subtract(records, visited):
+    """
+    Remove records present in another sorted stream (streaming set difference).
+
+    Args:
+        records: Sorted, duplicate-free record stream
+        visited: Sorted record stream to subtract
+
+    Yields:
+        bytes: Records not in visited
+    """
+    seen = next(visited, None)
+    for record in records:
+        while seen is not None and seen < record:
+            seen = next(visited, None)
+        if record != seen:
+            yield record
+
+
+def solve(board, memory_mb=64, workdir=None, max_layers=None, verbose=False):
+    """
+    Run an exhaustive push-level BFS with frontier layers stored on disk.
+
+    Args:
+        board: 2D list representing the level
+        memory_mb: Approximate memory budget for buffered successor records
+        workdir: Directory for layer files (temporary directory if None)
+        max_layers: Stop after this many pushes (None = no limit)
+        verbose: Print one line of statistics per layer
+
+    Returns:
+        dict: 'status' ('solved', 'unsolvable' or 'limit'), 'pushes'
+              (optimal push count when solved), 'states' and 'layers'.
+              'states' counts the distinct states in every completed layer,
+              plus the solved state itself; the partially expanded final
+              layer of a solved search is not counted.
+
+    Raises:
+        ValueError: If the board has no player
+    """
+    cells, neighbours, targets = build_graph(board)
+    live = find_live_cells(neighbours, targets)
+    index = {cell: i for i, cell in enumerate(cells)}
+    player, boxes = get_dynamic_state(board)
+    boxes = tuple(sorted(index[box] for box in boxes))
+
+    record_format = f">{len(boxes) + 1}H"
+    record_size = struct.calcsize(record_format)
+    pack = struct.Struct(record_format).pack
+    unpack = struct.Struct(record_format).unpack
+    buffer_limit = max(1024, int(memory_mb * 1024 * 1024) // (record_size + RECORD_OVERHEAD))
+
+    own_workdir = workdir is None
+    if own_workdir:
+        import tempfile
+        workdir = tempfile.mkdtemp(prefix='sokoban_bfs_')
+    os.makedirs(workdir, exist_ok=True)
+
+    def result(status, pushes, layers):
+        return {'status': status, 'pushes': pushes, 'states': total, 'layers': layers}
+
+    try:
+        start_player, _ = normalize_player(neighbours, set(boxes), index[player])
+        # Same rule as the game: solved once no box is off a target
+        if targets.issuperset(boxes):
+            total = 1
+            return result('solved', 0, 0)
+
+        layer_path = os.path.join(workdir, 'layer_0.bin')
+        visited_path = os.path.join(workdir, 'visited_0.bin')
+        write_records(layer_path, [pack(start_player, *boxes)])
+        shutil.copyfile(layer_path, visited_path)
+        total = 1
+        depth = 0
+
+        while max_layers is None or depth < max_layers:
+            started = time.perf_counter()
+            depth += 1
+
+            # Expand the frontier into sorted, de-duplicated runs
+            runs = []
+            buffer = []
+            solved = False
+            for record in iter_records(layer_path, record_size):
+                state = unpack(record)
+                for new_player, new_boxes in expand(neighbours, live, state[1:], state[0]):
+                    if targets.issuperset(new_boxes):
+                        # Push-optimal: no need to expand the rest of the layer
+                        solved = True
+                        break
+                    buffer.append(pack(new_player, *new_boxes))
+                    if len(buffer) >= buffer_limit:
+                        buffer.sort()
+                        runs.append(os.path.join(workdir, f"run_{len(runs)}.bin"))
+                        write_records(runs[-1], unique(buffer))
+                        buffer = []
+                if solved:
+                    break
+            if solved:
+                for run in runs:
+                    os.remove(run)
+                total += 1
+                return result('solved', depth, depth)
+            if buffer:
+                buffer.sort()
+                runs.append(os.path.join(workdir, f"run_{len(runs)}.bin"))
+                write_records(runs[-1], unique(buffer))
+                buffer = []
+
+            # Merge runs and drop states seen in earlier layers
+            runs = merge_runs(runs, record_size, workdir)
+            streams = [iter_records(run, record_size) for run in runs]
+            new_layer_path = os.path.join(workdir, f"layer_{depth}.bin")
+            count = write_records(new_layer_path, subtract(
+                unique(heapq.merge(*streams)), iter_records(visited_path, record_size)))
+            for run in runs:
+                os.remove(run)
+            os.remove(layer_path)
+            layer_path = new_layer_path
+            total += count
+
+            if verbose:
+                elapsed = time.perf_counter() - started
+                print(f"Layer {depth}: {count} new states, {total} total ({elapsed:.2f}s)")
+            if count == 0:
+                return result('unsolvable', None, depth)
+
+            # Fold the new layer into the visited set
+            new_visited_path = os.path.join(workdir, f"visited_{depth}.bin")
+            write_records(new_visited_path, heapq.merge(
+                iter_records(visited_path, record_size), iter_records(layer_path, record_size)))
+            os.remove(visited_path)
+            visited_path = new_visited_path
+
+        return result('limit', None, depth)
+    finally:
+        if own_workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Prove optimal push counts with external-memory BFS.")
+    parser.add_argument('level', type=int, help="level number (0-50)")
+    parser.add_argument('--memory-mb', type=float, default=64, help="memory budget for buffered states")
+    parser.add_argument('--workdir', default=None, help="directory for layer files")
+    parser.add_argument('--max-layers', type=int, default=None, help="stop after this many pushes")
+    args = parser.parse_args()
+
+    board = get_level(args.level)
+    if board is None:
+        print("Error loading level!")
+        return
+
+    started = time.perf_counter()
+    try:
+        outcome = solve(board, args.memory_mb, args.workdir, args.max_layers, verbose=True)
+    except ValueError as error:
+        print(f"Level {args.level}: {error}")
+        return
+    elapsed = time.perf_counter() - started
+    if outcome['status'] == 'solved':
+        print(f"Level {args.level}: optimal solution has {outcome['pushes']} pushes")
+    elif outcome['status'] == 'unsolvable':
+        print(f"Level {args.level}: proven unsolvable")
+    else:
+        print(f"Level {args.level}: no solution within {outcome['layers']} pushes")
+    print(f"{outcome['states']} distinct states in completed layers, {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
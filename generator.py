@@ -0,0 +1,340 @@
+"""
+Procedural level generator for Sokoban game.
+Builds random rooms and scrambles them by pulling boxes backwards from the
+solved state, so every generated level is solvable by construction.
+
+Usage:
+    python generator.py --count 100 --seed 7 --out generated
+    python generator.py --count 500 --boxes 4 --workers 8 --pack pack.xsb
+"""
+
+import os
+import random
+
+from external_bfs import solve
+from helpers import copy_board, is_win
+from main import get_direction_step, move_player
+
+DIRECTIONS = ['w', 'a', 's', 'd']
+# Smallest board (including the outer wall) with room to push a box
+MIN_SIZE = 4
+
+OPPOSITE = {'w': 's', 's': 'w', 'a': 'd', 'd': 'a'}
+
+
+def carve_room(rng, width, height, fill):
+    """
+    Carve a random connected room by walking through a block of walls.
+
+    Args:
+        rng: random.Random instance
+        width: Board width including the outer wall
+        height: Board height including the outer wall
+        fill: Fraction of the interior to turn into floor (0-1)
+
+    Returns:
+        set: (row, col) floor cells, all connected
+    """
+    interior = (width - 2) * (height - 2)
+    # Never ask for more floor than the interior has, or the walk never ends
+    wanted = min(interior, max(4, int(interior * fill)))
+    row, col = rng.randrange(1, height - 1), rng.randrange(1, width - 1)
+    floor = {(row, col)}
+    while len(floor) < wanted:
+        vertical_step, horizontal_step = get_direction_step(rng.choice(DIRECTIONS))
+        if 1 <= row + vertical_step < height - 1 and 1 <= col + horizontal_step < width - 1:
+            row += vertical_step
+            col += horizontal_step
+            floor.add((row, col))
+    return floor
+
+
+def scramble(rng, floor, targets, player, steps):
+    """
+    Walk the player around the solved level, randomly pulling boxes.
+    Each pull is the exact reverse of a push, so replaying the walk
+    backwards solves the level.
+
+    Args:
+        rng: random.Random instance
+        floor: Set of floor cells
+        targets: Set of target cells (boxes start on them)
+        player: Starting player position
+        steps: Number of random walk steps
+
+    Returns:
+        player, boxes, walk: Final player position, set of box positions
+                             and list of (direction, pulled) steps taken
+    """
+    boxes = set(targets)
+    walk = []
+    for _ in range(steps):
+        direction = rng.choice(DIRECTIONS)
+        vertical_step, horizontal_step = get_direction_step(direction)
+        next_cell = (player[0] + vertical_step, player[1] + horizontal_step)
+        if next_cell not in floor or next_cell in boxes:
+            continue
+        behind = (player[0] - vertical_step, player[1] - horizontal_step)
+        pulled = behind in boxes and rng.random() < 0.5
+        if pulled:
+            boxes.remove(behind)
+            boxes.add(player)
+        player = next_cell
+        walk.append((direction, pulled))
+    return player, boxes, walk
+
+
+def score_difficulty(board, max_pushes):
+    """
+    Score a level by its optimal number of pushes.
+    The rooms are small, so an exhaustive push search is cheap.
+
+    Args:
+        board: 2D list representing the level
+        max_pushes: Known upper bound (pushes in the scramble replay)
+
+    Returns:
+        int: Optimal push count, or None if no solution was found
+    """
+    outcome = solve(board, max_layers=max_pushes)
+    return outcome['pushes'] if outcome['status'] == 'solved' else None
+
+
+def simplify_replay(solution):
+    """
+    Drop walking steps that are immediately walked back (e.g. "lr").
+    Such pairs leave the player and boxes where they were, so the
+    shortened replay still solves the level.
+
+    Args:
+        solution: Move string in lurd notation (uppercase = push)
+
+    Returns:
+        str: Shorter replay in lurd notation
+    """
+    opposite = {'l': 'r', 'r': 'l', 'u': 'd', 'd': 'u'}
+    moves = []
+    for move in solution:
+        if move.islower() and moves and moves[-1] == opposite[move]:
+            moves.pop()
+        else:
+            moves.append(move)
+    return ''.join(moves)
+
+
+def to_lurd(walk):
+    """
+    Convert a reversed scramble walk into a forward solution string.
+
+    Args:
+        walk: List of (direction, pulled) steps from scramble()
+
+    Returns:
+        str: Solution in lurd notation, pushes in uppercase
+    """
+    lurd = {'w': 'u', 'a': 'l', 's': 'd', 'd': 'r'}
+    moves = []
+    for direction, pulled in reversed(walk):
+        move = lurd[OPPOSITE[direction]]
+        moves.append(move.upper() if pulled else move)
+    return ''.join(moves)
+
+
+def verify_solution(board, solution):
+    """
+    Replay a solution through the game's own move rules.
+
+    Args:
+        board: 2D list representing the level (left unchanged)
+        solution: Move string in lurd notation
+
+    Returns:
+        bool: True if the solution solves the level
+    """
+    wasd = {'u': 'w', 'l': 'a', 'd': 's', 'r': 'd'}
+    board = copy_board(board)
+    for move in solution:
+        if not move_player(board, wasd[move.lower()]):
+            return False
+    return is_win(board)
+
+
+def generate_level(seed, index, width=10, height=8, num_boxes=3,
+                   fill=0.55, steps=400, attempts=50, min_pushes=6):
+    """
+    Generate one verified level. Deterministic for a given seed and index.
+    Returns the first room needing at least min_pushes pushes, or the
+    hardest room found if none does.
+
+    Args:
+        seed: Seed of the whole level set
+        index: Level number within the set
+        width, height: Board size including the outer wall
+        num_boxes: Number of boxes and targets
+        fill: Fraction of the interior that becomes floor
+        steps: Length of each scrambling walk
+        attempts: Rooms to try before giving up
+        min_pushes: Optimal push count that is hard enough to stop searching
+
+    Returns:
+        dict: {'board', 'replay', 'difficulty'} or None if every attempt failed,
+              where difficulty is the optimal push count and replay is the
+              (simplified) scramble walk played forwards
+
+    Raises:
+        ValueError: If the board is smaller than MIN_SIZE in either direction
+    """
+    if width < MIN_SIZE or height < MIN_SIZE:
+        raise ValueError(f"Board must be at least {MIN_SIZE}x{MIN_SIZE}, got {width}x{height}")
+    rng = random.Random(f"{seed}:{index}")
+    best = None
+    for _ in range(attempts):
+        floor = carve_room(rng, width, height, fill)
+        cells = sorted(floor)
+        if len(cells) < num_boxes + 3:
+            continue
+        placed = rng.sample(cells, num_boxes + 1)
+        targets = set(placed[:num_boxes])
+        player, boxes, walk = scramble(rng, floor, targets, placed[-1], steps)
+        if boxes == targets:
+            continue
+
+        # Crop to the room plus its surrounding wall
+        top = min(row for row, _ in floor) - 1
+        left = min(col for _, col in floor) - 1
+        bottom = max(row for row, _ in floor) + 1
+        right = max(col for _, col in floor) + 1
+        board = [['#'] * (right - left + 1) for _ in range(bottom - top + 1)]
+        for row, col in floor:
+            board[row - top][col - left] = '.' if (row, col) in targets else ' '
+        for row, col in boxes:
+            board[row - top][col - left] = '*' if (row, col) in targets else '$'
+        board[player[0] - top][player[1] - left] = '+' if player in targets else '@'
+
+        replay = simplify_replay(to_lurd(walk))
+        if not verify_solution(board, replay):
+            continue
+        difficulty = score_difficulty(board, sum(1 for move in replay if move.isupper()))
+        if difficulty is None:
+            continue
+        if best is None or difficulty > best['difficulty']:
+            best = {'board': board, 'replay': replay, 'difficulty': difficulty}
+        if difficulty >= min_pushes:
+            break
+    return best
+
+
+def _generate_job(args):
+    """Process pool entry point: unpack arguments for generate_level()."""
+    seed, index, options = args
+    return generate_level(seed, index, **options)
+
+
+def generate_levels(count, seed, workers=None, **options):
+    """
+    Generate a set of levels across a process pool.
+    Results are in index order, so the set only depends on the seed.
+
+    Args:
+        count: Number of levels to generate
+        seed: Seed of the level set
+        workers: Number of worker processes (None = CPU count)
+        **options: Passed to generate_level()
+
+    Returns:
+        list: Level dicts from generate_level() (failed slots skipped)
+    """
+    # Imported here: the process pool is slow to import and only needed
+    # when generating a whole set
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = [(seed, index, options) for index in range(count)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_generate_job, jobs, chunksize=max(1, count // 64))
+        return [level for level in results if level is not None]
+
+
+def board_to_xsb(board):
+    """
+    Convert a board to XSB text (trailing spaces removed).
+
+    Args:
+        board: 2D list representing the level
+
+    Returns:
+        str: XSB text, one line per row
+    """
+    return '\n'.join(''.join(row).rstrip() for row in board) + '\n'
+
+
+def write_levels(levels, out_dir):
+    """
+    Write levels as individual levelNNN.xsb files, readable by load_xsb_level().
+
+    Args:
+        levels: List of level dicts from generate_levels()
+        out_dir: Output directory (created if missing)
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    for number, level in enumerate(levels):
+        with open(os.path.join(out_dir, f"level{number:03d}.xsb"), 'w') as f:
+            f.write(board_to_xsb(level['board']))
+
+
+def write_collection(levels, filepath, seed):
+    """
+    Write levels into one packed collection, readable by load_xsb_collection().
+
+    Args:
+        levels: List of level dicts from generate_levels()
+        filepath: Output file path
+        seed: Seed of the set, recorded in the header
+    """
+    with open(filepath, 'w') as f:
+        f.write(f"; Generated Sokoban levels (seed {seed})\n\n")
+        for number, level in enumerate(levels):
+            f.write(board_to_xsb(level['board']))
+            f.write(f"; Level {number}\n")
+            f.write(f"; Optimal pushes: {level['difficulty']}\n")
+            f.write(f"; Scramble replay: {level['replay']}\n\n")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate solvable Sokoban levels.")
+    parser.add_argument('--count', type=int, default=50, help="number of levels")
+    parser.add_argument('--seed', default='0', help="seed of the level set")
+    parser.add_argument('--width', type=int, default=10, help="board width")
+    parser.add_argument('--height', type=int, default=8, help="board height")
+    parser.add_argument('--boxes', type=int, default=3, help="boxes per level")
+    parser.add_argument('--steps', type=int, default=400, help="scramble walk length")
+    parser.add_argument('--min-pushes', type=int, default=6,
+                        help="optimal pushes a level needs to be accepted early")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes")
+    parser.add_argument('--out', default=None, help="directory for levelNNN.xsb files")
+    parser.add_argument('--pack', default=None, help="write a packed collection file")
+    args = parser.parse_args()
+    if args.width < MIN_SIZE or args.height < MIN_SIZE:
+        parser.error(f"--width and --height must be at least {MIN_SIZE}")
+
+    levels = generate_levels(args.count, args.seed, workers=args.workers,
+                             width=args.width, height=args.height,
+                             num_boxes=args.boxes, steps=args.steps,
+                             min_pushes=args.min_pushes)
+    if args.out:
+        write_levels(levels, args.out)
+    if args.pack:
+        write_collection(levels, args.pack, args.seed)
+    if not args.out and not args.pack:
+        write_levels(levels, 'generated')
+
+    difficulties = sorted(level['difficulty'] for level in levels)
+    print(f"Generated {len(levels)}/{args.count} levels (seed {args.seed})")
+    if difficulties:
+        print(f"Optimal pushes: min {difficulties[0]} | "
+              f"median {difficulties[len(difficulties) // 2]} | max {difficulties[-1]}")
+
+
+if __name__ == "__main__":
+    main()
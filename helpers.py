@@ -5,15 +5,21 @@ Provides utility functions for game logic.
 
 import sys
 
+# Movement keys as (row, col) steps: up, left, down, right.
+# Shared by the game, the push generator and the solver.
+DIRECTION_STEPS = {'w': (-1, 0), 'a': (0, -1), 's': (1, 0), 'd': (0, 1)}
+
 # Cross-platform single character input (no Enter required)
 # Supports both WASD and arrow keys
+# Terminal modules are imported on first use, so code that never reads
+# the keyboard (tools, benchmarks, replays) never loads them
 if sys.platform == 'win32':
-    import msvcrt
-    
     def getch():
         """Get a single character from keyboard on Windows.
         Supports WASD and arrow keys.
         """
+        import msvcrt
+
         key = msvcrt.getch()
         
         # Check for arrow keys (Windows sends \xe0 followed by direction)
@@ -34,13 +40,13 @@ if sys.platform == 'win32':
         except (UnicodeDecodeError, AttributeError):
             return key.decode('latin-1').lower()
 else:
-    import termios
-    import tty
-    
     def getch():
         """Get a single character from keyboard on Unix/Mac.
         Supports WASD and arrow keys.
         """
+        import termios
+        import tty
+
         fd = sys.stdin.fileno()
         old_settings = termios.tcgetattr(fd)
         try:
@@ -128,6 +134,134 @@ def copy_board(board):
     return [row[:] for row in board]
 
 
+# Static/dynamic board layers
+# Walls and targets never change once a level is loaded, so they are kept in
+# a single shared static layer. Only the player and the boxes move; together
+# they form the dynamic state, which is all that snapshots and undo store.
+def get_static_layer(board):
+    """
+    Extract the immutable part of the board (walls, floor and targets).
+    The result is shared by every state of the level and never copied.
+
+    Args:
+        board: 2D list representing game state
+
+    Returns:
+        tuple: One string per row containing only '#', ' ' and '.'
+    """
+    static_cells = {'@': ' ', '$': ' ', '*': '.', '+': '.'}
+    return tuple(''.join(static_cells.get(cell, cell) for cell in row)
+                 for row in board)
+
+
+def get_dynamic_state(board):
+    """
+    Extract the mutable part of the board: player and box positions.
+    Boxes are sorted so that equal positions always give equal states,
+    which makes the state usable for equality checks and as a dict key.
+
+    Args:
+        board: 2D list representing game state
+
+    Returns:
+        tuple: (player, boxes) where player is (row, col) or None and
+               boxes is a sorted tuple of (row, col) positions
+    """
+    player = None
+    boxes = []
+    for row in range(len(board)):
+        for col in range(len(board[row])):
+            cell = board[row][col]
+            if cell == '$' or cell == '*':
+                boxes.append((row, col))
+            elif cell == '@' or cell == '+':
+                player = (row, col)
+    return player, tuple(boxes)
+
+
+def apply_dynamic_state(board, static_layer, state, current_state=None):
+    """
+    Overwrite the dynamic part of the board in place with a saved state.
+    Only the cells occupied by the current and the saved state are touched.
+
+    Args:
+        board: 2D list to update
+        static_layer: Static layer of the level (from get_static_layer)
+        state: Dynamic state to restore (from get_dynamic_state)
+        current_state: Dynamic state currently on the board, if known
+    """
+    if current_state is None:
+        current_state = get_dynamic_state(board)
+
+    # Clear the player and boxes back to the static layer
+    current_player, current_boxes = current_state
+    for row, col in current_boxes:
+        board[row][col] = static_layer[row][col]
+    if current_player is not None:
+        row, col = current_player
+        board[row][col] = static_layer[row][col]
+
+    # Place the saved boxes and player
+    player, boxes = state
+    for row, col in boxes:
+        board[row][col] = '*' if static_layer[row][col] == '.' else '$'
+    if player is not None:
+        row, col = player
+        board[row][col] = '+' if static_layer[row][col] == '.' else '@'
+
+
+def move_dynamic_state(state, vertical_step, horizontal_step):
+    """
+    Work out the dynamic state after a successful move, without scanning
+    the board. A box on the player's new cell is pushed one step further.
+
+    Args:
+        state: Dynamic state before the move (from get_dynamic_state)
+        vertical_step: Row step of the move
+        horizontal_step: Column step of the move
+
+    Returns:
+        tuple: (player, boxes) after the move
+    """
+    (row, col), boxes = state
+    player = (row + vertical_step, col + horizontal_step)
+    if player in boxes:
+        pushed = (player[0] + vertical_step, player[1] + horizontal_step)
+        boxes = tuple(sorted([box for box in boxes if box != player] + [pushed]))
+    return player, boxes
+
+
+def get_targets(static_layer):
+    """
+    Find all target locations of a level.
+
+    Args:
+        static_layer: Static layer of the level (from get_static_layer)
+
+    Returns:
+        frozenset: (row, col) of every target
+    """
+    return frozenset((row, col)
+                     for row, line in enumerate(static_layer)
+                     for col, cell in enumerate(line) if cell == '.')
+
+
+def build_board(static_layer, state):
+    """
+    Build a full 2D board from a static layer and a dynamic state.
+
+    Args:
+        static_layer: Static layer of the level (from get_static_layer)
+        state: Dynamic state (from get_dynamic_state)
+
+    Returns:
+        2D list: Independent board combining both layers
+    """
+    board = [list(row) for row in static_layer]
+    apply_dynamic_state(board, static_layer, state, current_state=(None, ()))
+    return board
+
+
 def count_boxes_on_targets(board):
     """
     Count how many boxes are currently on target locations.
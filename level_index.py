@@ -0,0 +1,242 @@
+"""
+Level metadata index for Sokoban game.
+Stores size, box count, floor area, estimated difficulty and best known
+solution length for every level in levels/index.json, so level select can
+list, sort and filter levels without opening any .xsb file.
+
+Usage:
+    python level_index.py              # rebuild levels/index.json
+    python level_index.py --solve 0 3  # also prove optimal push counts
+"""
+
+import json
+import math
+import os
+import re
+
+from levels import load_xsb_level
+
+INDEX_FILENAME = 'index.json'
+LEVEL_FILE_PATTERN = re.compile(r'^level(\d+)\.xsb$')
+
+# Fields that can be used in filters and sorting
+FIELDS = ['number', 'width', 'height', 'boxes', 'floor', 'difficulty', 'pushes']
+
+# Filter terms such as "boxes<=6", "width<40" or "pushes=12"
+TERM_PATTERN = re.compile(r'^([a-z]+)(<=|>=|<|>|=)(\d+(?:\.\d+)?)$')
+# Shorthand "fits 40x20" for width<=40 height<=20
+FITS_PATTERN = re.compile(r'fits\s+(\d+)x(\d+)')
+
+_index_cache = None
+
+
+def get_index_path():
+    """
+    Get the path of the index file.
+
+    Returns:
+        str: Path to levels/index.json
+    """
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(current_dir, 'levels', INDEX_FILENAME)
+
+
+def estimate_difficulty(floor, boxes):
+    """
+    Estimate difficulty as the size of the level's state space:
+    log10 of the number of ways to place the boxes and the player.
+
+    Args:
+        floor: Number of floor cells reachable by the player
+        boxes: Number of boxes
+
+    Returns:
+        float: Difficulty estimate (higher is harder)
+    """
+    if floor <= boxes:
+        return 0.0
+    return round(math.log10(math.comb(floor, boxes) * (floor - boxes)), 1)
+
+
+def describe_level(number, filename, board):
+    """
+    Collect the metadata stored in the index for one level.
+
+    Args:
+        number: Level number
+        filename: Level file name inside levels/
+        board: 2D list representing the level
+
+    Returns:
+        dict: Index entry for the level
+    """
+    # Imported here so reading the index never needs the solver
+    from external_bfs import build_graph
+
+    cells, _, _ = build_graph(board)
+    boxes = sum(row.count('$') + row.count('*') for row in board)
+    return {
+        'number': number,
+        'file': filename,
+        'width': len(board[0]),
+        'height': len(board),
+        'boxes': boxes,
+        'floor': len(cells),
+        'difficulty': estimate_difficulty(len(cells), boxes),
+        'pushes': None,
+    }
+
+
+def build_index(solve_levels=(), memory_mb=64):
+    """
+    Scan levels/ and write the metadata index.
+    Best known solution lengths already in the index are kept.
+
+    Args:
+        solve_levels: Level numbers to solve optimally with external_bfs
+        memory_mb: Memory budget for the solver
+
+    Returns:
+        list: Index entries sorted by level number
+    """
+    levels_dir = os.path.dirname(get_index_path())
+    try:
+        known = {entry['number']: entry['pushes'] for entry in load_index()}
+    except (OSError, ValueError):
+        known = {}
+
+    entries = []
+    for filename in sorted(os.listdir(levels_dir)):
+        match = LEVEL_FILE_PATTERN.match(filename)
+        if not match:
+            continue
+        board = load_xsb_level(filename)
+        if board is None:
+            continue
+        try:
+            entry = describe_level(int(match.group(1)), filename, board)
+        except ValueError as error:
+            print(f"Skipping {filename}: {error}")
+            continue
+        entry['pushes'] = known.get(entry['number'])
+        if entry['number'] in solve_levels:
+            from external_bfs import solve
+            outcome = solve(board, memory_mb)
+            if outcome['status'] == 'solved':
+                entry['pushes'] = outcome['pushes']
+        entries.append(entry)
+    entries.sort(key=lambda entry: entry['number'])
+
+    # One level per line keeps the file compact and diffs readable
+    with open(get_index_path(), 'w') as f:
+        f.write('{"version": 1, "levels": [\n')
+        f.write(',\n'.join(json.dumps(entry) for entry in entries))
+        f.write('\n]}\n')
+    global _index_cache
+    _index_cache = entries
+    return entries
+
+
+def load_index():
+    """
+    Load the metadata index (cached after the first call).
+
+    Returns:
+        list: Index entries sorted by level number
+    """
+    global _index_cache
+    if _index_cache is None:
+        with open(get_index_path(), 'r') as f:
+            _index_cache = json.load(f)['levels']
+    return _index_cache
+
+
+def parse_filter(text):
+    """
+    Parse a filter such as "boxes<=6 fits 40x20" into conditions.
+
+    Args:
+        text: Space-separated terms: <field><op><number> or "fits WxH"
+
+    Returns:
+        list: (field, operator, value) conditions
+
+    Raises:
+        ValueError: If a term is not understood
+    """
+    text = text.lower()
+    conditions = []
+    for width, height in FITS_PATTERN.findall(text):
+        conditions.append(('width', '<=', int(width)))
+        conditions.append(('height', '<=', int(height)))
+    text = FITS_PATTERN.sub('', text)
+
+    for term in text.replace(',', ' ').split():
+        match = TERM_PATTERN.match(term)
+        if not match or match.group(1) not in FIELDS:
+            raise ValueError(f"Unknown filter term: {term}")
+        conditions.append((match.group(1), match.group(2), float(match.group(3))))
+    return conditions
+
+
+def filter_levels(entries, conditions):
+    """
+    Keep the entries matching every condition.
+    Entries with an unknown value (e.g. no known solution) never match.
+
+    Args:
+        entries: Index entries
+        conditions: Conditions from parse_filter()
+
+    Returns:
+        list: Matching entries
+    """
+    compare = {
+        '<=': lambda a, b: a <= b,
+        '>=': lambda a, b: a >= b,
+        '<': lambda a, b: a < b,
+        '>': lambda a, b: a > b,
+        '=': lambda a, b: a == b,
+    }
+    result = entries
+    for field, operator, value in conditions:
+        result = [entry for entry in result
+                  if entry[field] is not None and compare[operator](entry[field], value)]
+    return result
+
+
+def sort_levels(entries, field, descending=False):
+    """
+    Sort entries by one field; unknown values always go last.
+
+    Args:
+        entries: Index entries
+        field: One of FIELDS
+        descending: Sort from highest to lowest
+
+    Returns:
+        list: Sorted entries
+    """
+    if field not in FIELDS:
+        raise ValueError(f"Unknown sort field: {field}")
+    known = [entry for entry in entries if entry[field] is not None]
+    unknown = [entry for entry in entries if entry[field] is None]
+    known.sort(key=lambda entry: (entry[field], entry['number']), reverse=descending)
+    return known + unknown
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the level metadata index.")
+    parser.add_argument('--solve', type=int, nargs='*', default=[],
+                        help="levels to solve for their optimal push count")
+    parser.add_argument('--memory-mb', type=float, default=64, help="memory budget for the solver")
+    args = parser.parse_args()
+
+    entries = build_index(set(args.solve), args.memory_mb)
+    print(f"Indexed {len(entries)} levels into {get_index_path()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,9 @@ Loads levels from XSB format files in the levels/ directory.
 
 import os
 
+# Level number -> file name, loaded from the level index on first use
+_level_files = None
+
 def load_xsb_level(filename):
     """
     Load a Sokoban level from an XSB format file.
@@ -64,22 +67,74 @@ def load_xsb_level(filename):
         return None
 
 
+def load_xsb_collection(filepath):
+    """
+    Load every level from a packed XSB collection file.
+
+    A collection holds several XSB levels separated by blank lines.
+    Lines starting with ';' are comments (titles, metadata) and are skipped.
+
+    Args:
+        filepath: Path to the collection file
+
+    Returns:
+        list: Board layouts (2D lists), in file order
+    """
+    with open(filepath, 'r') as f:
+        lines = f.readlines()
+
+    boards = []
+    rows = []
+    for line in lines + ['']:
+        stripped = line.rstrip()
+        if stripped.startswith(';'):
+            continue
+        if stripped:
+            rows.append(stripped)
+        elif rows:
+            # Blank line ends the current level; pad rows to equal width
+            max_width = max(len(row) for row in rows)
+            boards.append([list(row + ' ' * (max_width - len(row)))
+                           for row in rows])
+            rows = []
+    return boards
+
+
+def get_level_files():
+    """
+    Map level numbers to their file names.
+    Read from the prebuilt metadata index (levels/index.json, rebuilt with
+    level_index.py) instead of scanning the levels/ directory.
+
+    Returns:
+        dict: Level number -> file name inside levels/
+    """
+    global _level_files
+    if _level_files is None:
+        # Imported here because level_index imports this module
+        from level_index import load_index
+        try:
+            _level_files = {entry['number']: entry['file'] for entry in load_index()}
+        except (OSError, ValueError, KeyError):
+            # No usable index: fall back to the bundled level000-level050 files
+            _level_files = {number: f"level{number:03d}.xsb" for number in range(51)}
+    return _level_files
+
+
 def get_level(level_number):
     """
     Get the board layout for a specific level.
-    Loads from XSB format files (level000.xsb through level050.xsb).
+    Looks the file up in the level index (level000.xsb, level001.xsb, etc.).
 
     Args:
-        level_number: Integer 0-50
+        level_number: Level number listed in the index
 
     Returns:
         2D list: Board layout for the level, or None if invalid
     """
-    if level_number < 0 or level_number > 50:
+    filename = get_level_files().get(level_number)
+    if filename is None:
         return None
-    
-    # Format filename as level000.xsb, level001.xsb, etc.
-    filename = f"level{level_number:03d}.xsb"
     return load_xsb_level(filename)
 
 
@@ -88,7 +143,6 @@ def get_total_levels():
     Get the total number of available levels.
 
     Returns:
-        int: Total number of levels (51)
+        int: Number of levels listed in the level index
     """
-    return 51
-
+    return len(get_level_files())
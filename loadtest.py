@@ -0,0 +1,240 @@
+"""
+Scripted-input load driver for Sokoban game.
+Pushes a stream of random keys through the real play_single_level() loop
+(clear_screen, print_board and all) and reports per-frame latency and
+output size, so changes can be judged by what a player actually sees.
+
+Output goes either to a null sink or to a pseudo-terminal whose other end
+is drained by a background thread (the pty makes stdout a real terminal,
+so colored rendering is measured too).
+
+Usage:
+    python loadtest.py --moves 20000 --levels 0 10 48
+    python loadtest.py --sink pty --moves 5000
+"""
+
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+import display
+import main as game
+from levels import get_level
+
+
+class CountingSink:
+    """Text stream wrapper that counts the UTF-8 bytes written through it."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.bytes_written = 0
+
+    def write(self, text):
+        self.bytes_written += len(text.encode('utf-8'))
+        return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def isatty(self):
+        return self.stream.isatty()
+
+    def fileno(self):
+        return self.stream.fileno()
+
+
+class ScriptedKeys:
+    """
+    Replacement for getch() that replays a key script and timestamps frames.
+    Every getch() call marks the end of one rendered frame.
+    """
+
+    def __init__(self, keys, sink):
+        self.keys = keys
+        self.position = 0
+        self.sink = sink
+        self.latencies = []
+        self.frame_bytes = []
+        self.last_time = None
+        self.last_bytes = 0
+
+    def finished(self):
+        return self.position >= len(self.keys)
+
+    def getch(self):
+        now = time.perf_counter()
+        if self.last_time is not None:
+            self.latencies.append(now - self.last_time)
+            self.frame_bytes.append(self.sink.bytes_written - self.last_bytes)
+        self.last_bytes = self.sink.bytes_written
+
+        if self.finished():
+            # Script exhausted: confirm quitting the level
+            key = 'y' if self.position > len(self.keys) else 'q'
+            self.position += 1
+        else:
+            key = self.keys[self.position]
+            self.position += 1
+        self.last_time = time.perf_counter()
+        return key
+
+
+def make_script(moves, seed):
+    """
+    Build a deterministic key script: mostly moves, with occasional undo.
+
+    Args:
+        moves: Number of keys
+        seed: Random seed
+
+    Returns:
+        list: Keys understood by play_single_level()
+    """
+    rng = random.Random(seed)
+    return rng.choices(['w', 'a', 's', 'd', 'u'], weights=[24, 24, 24, 24, 4], k=moves)
+
+
+def open_sink(kind):
+    """
+    Redirect file descriptor 1 to the chosen sink.
+
+    Args:
+        kind: 'null' or 'pty'
+
+    Returns:
+        stream, cleanup, received: Text stream for sys.stdout, a function that
+        restores the original stdout, and a one-item list with the number of
+        bytes seen by the terminal end (pty only, includes clear_screen output)
+    """
+    saved_fd = os.dup(1)
+    received = [0]
+    reader = None
+
+    if kind == 'pty':
+        import pty
+        master, slave = pty.openpty()
+        os.dup2(slave, 1)
+        os.close(slave)
+
+        def drain():
+            while True:
+                try:
+                    data = os.read(master, 65536)
+                except OSError:
+                    return
+                if not data:
+                    return
+                received[0] += len(data)
+
+        reader = threading.Thread(target=drain, daemon=True)
+        reader.start()
+    else:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, 1)
+        os.close(devnull)
+
+    stream = open(1, 'w', encoding='utf-8', closefd=False)
+
+    def cleanup():
+        stream.flush()
+        os.dup2(saved_fd, 1)
+        os.close(saved_fd)
+        if reader is not None:
+            # Let the reader drain what is left before closing the terminal
+            time.sleep(0.1)
+            os.close(master)
+            reader.join(timeout=1)
+
+    return stream, cleanup, received
+
+
+def run_level(level_number, moves, seed, sink_kind):
+    """
+    Drive one level through the real game loop with a scripted key stream.
+    The level is replayed from the start whenever it is solved.
+
+    Args:
+        level_number: Level to play
+        moves: Number of scripted keys
+        seed: Seed for the key script
+        sink_kind: 'null' or 'pty'
+
+    Returns:
+        dict: Frame latencies (seconds), bytes per frame and terminal byte count
+    """
+    stream, cleanup, received = open_sink(sink_kind)
+    sink = CountingSink(stream)
+    keys = ScriptedKeys(make_script(moves, seed), sink)
+
+    original = (sys.stdout, game.getch, getattr(game, 'input', None))
+    sys.stdout = sink
+    game.getch = keys.getch
+
+    def scripted_input(prompt=''):
+        sink.write(prompt)
+        return ''
+
+    game.input = scripted_input
+    # Render for the sink's terminal, not the one we were started from
+    display.init_display()
+    try:
+        while game.play_single_level(level_number) and not keys.finished():
+            pass
+    finally:
+        sys.stdout, game.getch = original[0], original[1]
+        if original[2] is None:
+            del game.input
+        else:
+            game.input = original[2]
+        cleanup()
+        display.init_display()
+
+    return {'latencies': keys.latencies, 'frame_bytes': keys.frame_bytes,
+            'terminal_bytes': received[0]}
+
+
+def percentile(sorted_values, fraction):
+    """Return the value at the given fraction (0-1) of a sorted list."""
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Measure end-to-end frame latency of the game loop.")
+    parser.add_argument('--levels', type=int, nargs='+', default=[0, 10, 48],
+                        help="levels to drive")
+    parser.add_argument('--moves', type=int, default=10000, help="scripted keys per level")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the key script")
+    parser.add_argument('--sink', choices=['null', 'pty'], default='null',
+                        help="where game output goes")
+    args = parser.parse_args()
+
+    print(f"{'Level':>5} {'Size':>7} {'Frames':>7} {'p50 ms':>8} {'p90 ms':>8} "
+          f"{'p99 ms':>8} {'max ms':>8} {'B/frame':>8} {'term B/frame':>12}")
+    for level_number in args.levels:
+        board = get_level(level_number)
+        if board is None:
+            print(f"{level_number:>5} Error loading level!")
+            continue
+        result = run_level(level_number, args.moves, args.seed, args.sink)
+        latencies = sorted(result['latencies'])
+        frames = len(latencies)
+        if not frames:
+            continue
+        size = f"{len(board[0])}x{len(board)}"
+        term = f"{result['terminal_bytes'] / frames:.0f}" if args.sink == 'pty' else '-'
+        print(f"{level_number:>5} {size:>7} {frames:>7} "
+              f"{percentile(latencies, 0.50) * 1000:>8.3f} "
+              f"{percentile(latencies, 0.90) * 1000:>8.3f} "
+              f"{percentile(latencies, 0.99) * 1000:>8.3f} "
+              f"{latencies[-1] * 1000:>8.3f} "
+              f"{statistics.mean(result['frame_bytes']):>8.0f} {term:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,14 @@ Sokoban Puzzle Game - Week 18
 A warehouse puzzle game where you push boxes onto target locations.
 """
 
-from display import *
-from helpers import *
-from levels import *
+from display import (LEVEL_LIST_PAGE_SIZE, Colors, clear_screen, init_display,
+                     print_board_viewport, print_controls, print_level_complete_menu,
+                     print_level_header, print_level_list, print_level_select_prompt,
+                     print_main_menu, print_win_message)
+from helpers import (DIRECTION_STEPS, apply_dynamic_state, get_dynamic_state,
+                     get_player_position, get_static_layer, get_targets, getch,
+                     move_dynamic_state)
+from levels import get_level
 
 def get_direction_step(direction):
     """
@@ -18,16 +23,7 @@ def get_direction_step(direction):
     Returns:
         vertical_step, horizontal_step: Two values representing the direction step
     """
-    if direction == 'w':
-        return -1, 0  # up
-    elif direction == 'a':
-        return 0, -1  # left
-    elif direction == 's':
-        return 1, 0   # down
-    elif direction == 'd':
-        return 0, 1   # right
-    else:
-        return 0, 0
+    return DIRECTION_STEPS.get(direction, (0, 0))
 
 
 def is_valid_move(board, row, column):
@@ -58,7 +54,7 @@ def is_valid_move(board, row, column):
     return True
 
 
-def move_player(board, direction):
+def move_player(board, direction, player_pos=None):
     """
     Move player in specified direction if valid.
     This function is from Week 17 and is already implemented.
@@ -66,11 +62,13 @@ def move_player(board, direction):
     Args:
         board: Game board
         direction: 'w', 'a', 's', or 'd'
+        player_pos: (row, col) of the player, found on the board if None
 
     Returns:
         bool: True if moved, False if blocked
     """
-    player_pos = get_player_position(board)
+    if player_pos is None:
+        player_pos = get_player_position(board)
     if player_pos is None:
         return False
     
@@ -91,7 +89,7 @@ def move_player(board, direction):
     # Check if there's a box (handled by push_box in Week 18)
     # For now, if there's a box, the player cannot move
     if detect_box(board, target_row, target_column):
-        return push_box(board, direction)
+        return push_box(board, direction, player_pos)
     
     # Move player (no box in the way)
     current_cell = board[player_row][player_column]
@@ -158,8 +156,9 @@ def can_push_box(board, box_row, box_column, direction):
 # ============================================================================
 # TODO: STEP #3: Implement push_box() function
 # ============================================================================
-def push_box(board, direction):
-    player_pos = get_player_position(board)
+def push_box(board, direction, player_pos=None):
+    if player_pos is None:
+        player_pos = get_player_position(board)
     if player_pos is None:
         return False
     
@@ -217,28 +216,39 @@ def play_single_level(level_number, return_to_menu_callback=None):
         print("Error loading level!")
         return False
     
+    # Walls and targets are shared by every state of the level; snapshots
+    # only hold the dynamic part (player and sorted box positions)
+    static_layer = get_static_layer(board)
+    initial_state = get_dynamic_state(board)
+    targets = get_targets(static_layer)
+    total_targets = len(targets)
+
+    # The current dynamic state is updated on every move, so a frame never
+    # has to scan the board to find the player or count boxes
+    state = initial_state
+
     # Initialize level state
     moves = 0
-    # TODO: BONUS #1: Implement undo system
     # BONUS #1: Undo system - Track move history, restore previous states
-    undo_history = []  # List to store board states for undo
+    undo_history = []  # List of dynamic states for undo
     max_undo = 10  # Maximum number of undo moves
+    viewport = (0, 0)  # Top-left visible cell for large levels
     
     # Level loop - continues until level is won, restarted, or player quits
     while True:
         clear_screen()
         print_level_header(level_number, moves)
-        print_board(board)
+        viewport = print_board_viewport(board, state[0], viewport)
         print_controls()
         
         # Show progress
-        boxes_on_targets = count_boxes_on_targets(board)
-        total_targets = count_total_targets(board)
+        player, boxes = state
+        boxes_on_targets = sum(1 for box in boxes if box in targets)
         if total_targets > 0:
             print(f"Progress: {boxes_on_targets}/{total_targets} boxes on targets")
         
-        # Check win condition
-        if is_win(board):
+        # Check win condition (no box left off a target)
+        if boxes_on_targets == len(boxes):
             print_win_message(level_number, moves)
             return True  # Level completed
         
@@ -265,35 +275,34 @@ def play_single_level(level_number, return_to_menu_callback=None):
             print(confirm)
             if confirm == 'y':
                 # Restart level
-                board = get_level(level_number)
+                apply_dynamic_state(board, static_layer, initial_state, state)
+                state = initial_state
                 moves = 0
                 undo_history = []
                 continue
             else:
                 continue
         elif user_input == 'u':
-            # TODO: BONUS #1: Implement undo last move
             # BONUS #1: Undo last move
-            # - Check if undo_history has any moves
-            # - If yes, restore the previous board state using undo_history.pop()
-            # - Decrement moves counter
-            # - If no moves to undo, display message
-            print("No moves to undo!")
-            input("Press Enter to continue...")
+            if undo_history:
+                previous_state = undo_history.pop()
+                apply_dynamic_state(board, static_layer, previous_state, state)
+                state = previous_state
+                moves -= 1
+            else:
+                print("No moves to undo!")
+                input("Press Enter to continue...")
             continue
         elif user_input in ['w', 'a', 's', 'd']:
-            # TODO: BONUS #1: Save state for undo before making move
-            # BONUS #1: Save state for undo before making move
-            # - Check if undo_history is at max_undo limit
-            # - If at limit, remove oldest state using undo_history.pop(0)
-            # - Add current board state to undo_history using copy_board(board)
-            
             # Attempt to move player
-            if move_player(board, user_input):
+            if move_player(board, user_input, state[0]):
                 moves += 1
-            else:
-                # Move failed - undo state saving would be handled here if implemented
-                pass
+                # BONUS #1: Save the previous state for undo
+                if len(undo_history) >= max_undo:
+                    undo_history.pop(0)
+                undo_history.append(state)
+                vertical_step, horizontal_step = get_direction_step(user_input)
+                state = move_dynamic_state(state, vertical_step, horizontal_step)
         else:
             # Invalid input - ignore and continue
             continue
@@ -327,7 +336,7 @@ def play_progression_mode():
 
 
 # ============================================================================
-# TODO: BONUS #2: Implement show_main_menu() function
+# BONUS #2: show_main_menu() function
 # ============================================================================
 def show_main_menu():
     """
@@ -337,32 +346,96 @@ def show_main_menu():
     Returns:
         str: User's choice ('1', '2', or 'q')
     """
-    # TODO: BONUS #2: Implement show_main_menu() function
-    # - Display the main menu using print_main_menu()
-    # - Loop until valid input is received
-    # - Get user input using input()
-    # - Validate input (must be '1', '2', or 'q')
-    # - Return the validated choice
-    pass
+    print_main_menu()
+    while True:
+        choice = input("Enter your choice: ").strip().lower()
+        if choice in ['1', '2', 'q']:
+            return choice
+        print("Please enter 1, 2, or Q.")
 
 
 # ============================================================================
-# TODO: BONUS #2: Implement play_level_select_mode() function
+# BONUS #2: play_level_select_mode() function
 # ============================================================================
 def play_level_select_mode():
     """
-    Play level select mode: choose any level 0-50.
-    BONUS #2: Level Select Mode - Choose and play any level 0-50
+    Play level select mode: choose any level from the level index.
+    BONUS #2: Level Select Mode - Browse, filter and play any level.
+    Listing, sorting and filtering only read the metadata index,
+    so no level file is opened until a level is played.
     """
-    # TODO: BONUS #2: Implement play_level_select_mode() function
-    # - Set up a loop for level selection
-    # - Display level select prompt using print_level_select_prompt()
-    # - Get level number from user using validate_choice() (0-50)
-    # - Play the selected level using play_single_level()
-    # - After level completion, display menu using print_level_complete_menu()
-    # - Get user choice (M for menu, N for next level)
-    # - Handle returning to menu or going to next level
-    pass
+    # Imported here to keep the filter/sort helpers out of main's imports;
+    # the index itself is already loaded by get_level() via get_level_files()
+    from level_index import FIELDS, filter_levels, load_index, parse_filter, sort_levels
+
+    try:
+        entries = load_index()
+    except (OSError, ValueError, KeyError):
+        entries = []
+    if not entries:
+        print("\nThe level index (levels/index.json) is missing or unreadable.")
+        print("Run 'python level_index.py' to build it.")
+        input("Press Enter to return to the main menu...")
+        return
+    level_numbers = {entry['number'] for entry in entries}
+    first_level, last_level = entries[0]['number'], entries[-1]['number']
+
+    conditions = []
+    filter_text = 'no filter'
+    sort_field, descending = 'number', False
+    offset = 0  # First entry on the current page
+
+    while True:
+        shown = sort_levels(filter_levels(entries, conditions), sort_field, descending)
+        clear_screen()
+        print_level_select_prompt(first_level, last_level)
+        order = f"-{sort_field}" if descending else sort_field
+        print_level_list(shown, len(entries), f"{filter_text} | sorted by {order}", offset)
+
+        choice = input("\n> ").strip()
+        command = choice[:1].lower()
+        if command == 'm':
+            return
+        elif command == 'f':
+            try:
+                conditions = parse_filter(choice[1:])
+                filter_text = choice[1:].strip() or 'no filter'
+                offset = 0
+            except ValueError as error:
+                print(error)
+                input("Press Enter to continue...")
+        elif command == 's':
+            field = choice[1:].strip().lower()
+            if field.lstrip('-') in FIELDS:
+                sort_field = field.lstrip('-')
+                descending = field.startswith('-')
+                offset = 0
+            else:
+                print(f"Unknown sort field: {field}")
+                input("Press Enter to continue...")
+        elif command == 'n' and choice[1:].strip() == '':
+            if offset + LEVEL_LIST_PAGE_SIZE < len(shown):
+                offset += LEVEL_LIST_PAGE_SIZE
+        elif command == 'p' and choice[1:].strip() == '':
+            offset = max(0, offset - LEVEL_LIST_PAGE_SIZE)
+        elif choice.isdigit() and int(choice) in level_numbers:
+            level_number = int(choice)
+            while play_single_level(level_number):
+                # BONUS #2: Menu after level completion
+                print_level_complete_menu()
+                next_choice = ''
+                while next_choice not in ['m', 'n']:
+                    next_choice = input("Enter your choice: ").strip().lower()
+                if next_choice == 'm':
+                    return
+                if level_number + 1 not in level_numbers:
+                    print("That was the last level!")
+                    input("Press Enter to continue...")
+                    break
+                level_number += 1
+        else:
+            print(f"Please choose a level between {first_level} and {last_level}.")
+            input("Press Enter to continue...")
 
 
 def main():
@@ -370,31 +443,26 @@ def main():
     Main game loop with menu system.
     This game loop structure is provided to students with comments.
     """
-    # TODO: BONUS #2: Implement main menu loop
+    # Detect terminal capabilities once and compile the render tables
+    init_display()
+
     # BONUS #2: Main menu loop - Choose between Progression Mode and Level Select Mode
-    # For now, just play progression mode directly
-    # Once BONUS #2 is implemented, uncomment the menu loop below
-    
-    # Simplified version - just play progression mode
-    play_progression_mode()
-    
-    # TODO: BONUS #2: Uncomment and implement the menu loop:
-    # while True:
-    #     choice = show_main_menu()
-    #     
-    #     if choice == '1':
-    #         # Progression Mode
-    #         play_progression_mode()
-    #     elif choice == '2':
-    #         # BONUS #2: Level Select Mode - Choose any level 0-50
-    #         play_level_select_mode()
-    #     elif choice == 'q':
-    #         # Quit game
-    #         clear_screen()
-    #         print("="*50)
-    #         print("Thanks for playing Sokoban!")
-    #         print("="*50)
-    #         break
+    while True:
+        choice = show_main_menu()
+        
+        if choice == '1':
+            # Progression Mode
+            play_progression_mode()
+        elif choice == '2':
+            # BONUS #2: Level Select Mode - Choose any level from the index
+            play_level_select_mode()
+        elif choice == 'q':
+            # Quit game
+            clear_screen()
+            print("="*50)
+            print("Thanks for playing Sokoban!")
+            print("="*50)
+            break
 
 
 if __name__ == "__main__":
@@ -0,0 +1,281 @@
+"""
+Push-level move generator for Sokoban game.
+Works in box pushes instead of single player steps: the player's reachable
+region is computed once per state and every legal push comes with the
+walking path that reaches it. Pushes are applied and reverted in place,
+so automated tools can search push space without copying the board.
+
+Example:
+    pushes = generate_pushes(board)
+    for push in pushes:
+        undo = apply_push(board, push)
+        ...                          # explore the new state
+        revert_push(board, push, undo)
+
+Usage:
+    python pushgen.py        # check against the game's move rules on every level
+    python pushgen.py 0 3
+"""
+
+from collections import deque
+
+from helpers import DIRECTION_STEPS, copy_board, get_dynamic_state, get_player_position
+
+
+def find_reachable(board, player):
+    """
+    Find every cell the player can walk to without pushing a box.
+    Uses breadth-first search, so the recorded paths are shortest.
+
+    Args:
+        board: 2D list representing game state
+        player: (row, col) of the player
+
+    Returns:
+        dict: Maps each reachable (row, col) to (previous cell, direction),
+              with None for the player's own cell
+    """
+    parents = {player: None}
+    queue = deque([player])
+    while queue:
+        row, col = queue.popleft()
+        for direction, (vertical_step, horizontal_step) in DIRECTION_STEPS.items():
+            cell = (row + vertical_step, col + horizontal_step)
+            if cell in parents:
+                continue
+            if not (0 <= cell[0] < len(board) and 0 <= cell[1] < len(board[cell[0]])):
+                continue
+            if board[cell[0]][cell[1]] in ' .':
+                parents[cell] = ((row, col), direction)
+                queue.append(cell)
+    return parents
+
+
+def get_path(parents, cell):
+    """
+    Rebuild the walking path to a reachable cell.
+
+    Args:
+        parents: Result of find_reachable()
+        cell: Destination (row, col)
+
+    Returns:
+        str: Directions ('w', 'a', 's', 'd') from the player to the cell
+    """
+    path = []
+    while parents[cell] is not None:
+        cell, direction = parents[cell]
+        path.append(direction)
+    return ''.join(reversed(path))
+
+
+def generate_pushes(board, player=None):
+    """
+    List every legal box push from the current state.
+
+    Args:
+        board: 2D list representing game state
+        player: (row, col) of the player, found on the board if None
+
+    Returns:
+        list: Pushes as (box_row, box_col, direction, path) tuples, where
+              path is the walk to the cell behind the box
+    """
+    if player is None:
+        player = get_player_position(board)
+        if player is None:
+            return []
+
+    parents = find_reachable(board, player)
+    pushes = []
+    for (row, col) in parents:
+        for direction, (vertical_step, horizontal_step) in DIRECTION_STEPS.items():
+            box_row, box_col = row + vertical_step, col + horizontal_step
+            target_row, target_col = box_row + vertical_step, box_col + horizontal_step
+            if not (0 <= target_row < len(board) and 0 <= target_col < len(board[target_row])):
+                continue
+            if board[box_row][box_col] not in '$*':
+                continue
+            # The player walks away from its own cell, so a box may be pushed onto it
+            if board[target_row][target_col] in ' .' or (target_row, target_col) == player:
+                pushes.append((box_row, box_col, direction, get_path(parents, (row, col))))
+    return pushes
+
+
+def push_to_moves(push):
+    """
+    Convert a push into the full key sequence for play_single_level().
+
+    Args:
+        push: (box_row, box_col, direction, path) from generate_pushes()
+
+    Returns:
+        str: Walking path followed by the push direction
+    """
+    return push[3] + push[2]
+
+
+def apply_push(board, push, player=None):
+    """
+    Walk to a box and push it, updating the board in place.
+
+    Args:
+        board: 2D list representing game state
+        push: (box_row, box_col, direction, path) from generate_pushes()
+        player: (row, col) of the player, found on the board if None
+
+    Returns:
+        tuple: Player position before the push, needed by revert_push()
+    """
+    if player is None:
+        player = get_player_position(board)
+    box_row, box_col, direction, _ = push
+    vertical_step, horizontal_step = DIRECTION_STEPS[direction]
+    target_row, target_col = box_row + vertical_step, box_col + horizontal_step
+
+    # Player leaves its cell first (the box may be pushed onto it),
+    # then the box moves on and the player takes the box's cell
+    board[player[0]][player[1]] = '.' if board[player[0]][player[1]] == '+' else ' '
+    board[target_row][target_col] = '*' if board[target_row][target_col] == '.' else '$'
+    board[box_row][box_col] = '+' if board[box_row][box_col] == '*' else '@'
+    return player
+
+
+def revert_push(board, push, player):
+    """
+    Undo a push made with apply_push(), updating the board in place.
+
+    Args:
+        board: 2D list representing game state
+        push: The push that was applied
+        player: Value returned by apply_push()
+    """
+    box_row, box_col, direction, _ = push
+    vertical_step, horizontal_step = DIRECTION_STEPS[direction]
+    target_row, target_col = box_row + vertical_step, box_col + horizontal_step
+
+    # Reverse order of apply_push(): the player goes back last, in case the
+    # box had been pushed onto the player's old cell
+    board[target_row][target_col] = '.' if board[target_row][target_col] == '*' else ' '
+    board[box_row][box_col] = '*' if board[box_row][box_col] == '+' else '$'
+    board[player[0]][player[1]] = '+' if board[player[0]][player[1]] == '.' else '@'
+
+
+def find_pushes_by_stepping(board):
+    """
+    List every legal push by walking the player one step at a time with
+    the game's own move_player(). Slow, but independent of generate_pushes(),
+    so the two can be compared.
+
+    Args:
+        board: 2D list representing game state (left unchanged)
+
+    Returns:
+        set: (box_row, box_col, direction) for every legal push
+    """
+    # Imported here: the game module is only needed for this check
+    from main import move_player
+
+    start, boxes = get_dynamic_state(board)
+    if start is None:
+        return set()
+    seen = {start}
+    walks = [copy_board(board)]
+    pushes = set()
+    while walks:
+        walk = walks.pop()
+        player, _ = get_dynamic_state(walk)
+        for direction in DIRECTION_STEPS:
+            after = copy_board(walk)
+            if not move_player(after, direction, player):
+                continue
+            moved, moved_boxes = get_dynamic_state(after)
+            if moved_boxes != boxes:
+                pushes.add((moved[0], moved[1], direction))
+            elif moved not in seen:
+                seen.add(moved)
+                walks.append(after)
+    return pushes
+
+
+def check_pushes(board):
+    """
+    Compare generate_pushes(), apply_push() and revert_push() with the
+    game's step-by-step rules on one board.
+
+    Args:
+        board: 2D list representing game state (left unchanged)
+
+    Returns:
+        list: Descriptions of every mismatch (empty if they agree)
+    """
+    from main import move_player
+
+    errors = []
+    pushes = generate_pushes(board)
+    generated = {(box_row, box_col, direction) for box_row, box_col, direction, _ in pushes}
+    expected = find_pushes_by_stepping(board)
+    for push in sorted(expected - generated):
+        errors.append(f"missing push {push}")
+    for push in sorted(generated - expected):
+        errors.append(f"illegal push {push}")
+
+    for push in pushes:
+        stepped = copy_board(board)
+        for key in push_to_moves(push):
+            move_player(stepped, key)
+        pushed = copy_board(board)
+        undo = apply_push(pushed, push)
+        if pushed != stepped:
+            errors.append(f"apply_push differs from stepping for {push[:3]}")
+        revert_push(pushed, push, undo)
+        if pushed != board:
+            errors.append(f"revert_push does not restore the board for {push[:3]}")
+    return errors
+
+
+def main():
+    import argparse
+    import sys
+
+    from levels import get_level, get_total_levels
+
+    parser = argparse.ArgumentParser(description="Check the push generator against the game's move rules.")
+    parser.add_argument('levels', type=int, nargs='*', help="levels to check (default: all)")
+    args = parser.parse_args()
+
+    # Small rooms with pushes that are easy to get wrong, e.g. onto the player's cell
+    boards = [
+        ('room with a box next to the player', [list(row) for row in [
+            '#####',
+            '#   #',
+            '#@$ #',
+            '#   #',
+            '#####',
+        ]]),
+        ('corridor with two boxes', [list(row) for row in [
+            '#######',
+            '#.$@$.#',
+            '#######',
+        ]]),
+    ]
+    for number in args.levels or range(get_total_levels()):
+        board = get_level(number)
+        if board is not None:
+            boards.append((f"level {number}", board))
+
+    failed = 0
+    for name, board in boards:
+        errors = check_pushes(board)
+        if errors:
+            failed += 1
+            print(f"{name}: {len(errors)} mismatches")
+            for error in errors[:10]:
+                print(f"  {error}")
+    print(f"Checked {len(boards)} boards, {failed} with mismatches")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()